@@ -11,38 +11,88 @@ It will:
 5. Remove itself (this script)
 """
 
+import errno
+import os
 import re
-import shutil
+import stat
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
+# Paths the script operates on, relative to the template root
+SRC = Path("src")
+PYPROJECT = Path("pyproject.toml")
+
+# Pre-compiled patterns for the name converters
+_SNAKE_SEP = re.compile(r'[-\s]+')
+_SNAKE_STRIP = re.compile(r'[^\w]')
+_KEBAB_SEP = re.compile(r'[_\s]+')
+_KEBAB_STRIP = re.compile(r'[^\w-]')
+
+# stat() errors that mean a path does not exist
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+# Accepted answers for the yes/no prompts
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+# Horizontal rule used by the banner blocks
+_RULE = "=" * 60
+
+# Placeholder fields in pyproject.toml, matched in a single pass over the raw bytes
+_PYPROJECT_RE = re.compile(
+    rb'(?P<name>name = "template-package")'
+    rb'|(?P<description>(?i:description = ".*template.*"))'
+    rb'|(?P<author_name>name = "Your Name")'
+    rb'|(?P<author_email>email = "your\.email@example\.com")'
+)
+
+
+def _probe(path: Path) -> os.stat_result | None:
+    """Stat a path once, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except OSError as e:
+        # Same errors Path.exists() treats as "does not exist"
+        if e.errno in _MISSING_ERRNOS:
+            return None
+        raise
+
+
+def _is_file(st: os.stat_result | None) -> bool:
+    """Check whether a cached stat result describes a regular file."""
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+
+@lru_cache(maxsize=128)
 def to_snake_case(name: str) -> str:
     """Convert a name to snake_case for Python package names."""
     # Replace hyphens and spaces with underscores
-    name = re.sub(r'[-\s]+', '_', name)
+    name = _SNAKE_SEP.sub('_', name)
     # Remove any non-alphanumeric characters except underscores
-    name = re.sub(r'[^\w]', '', name)
+    name = _SNAKE_STRIP.sub('', name)
     # Convert to lowercase
     return name.lower()
 
 
+@lru_cache(maxsize=128)
 def to_kebab_case(name: str) -> str:
     """Convert a name to kebab-case for project names."""
     # Replace underscores and spaces with hyphens
-    name = re.sub(r'[_\s]+', '-', name)
+    name = _KEBAB_SEP.sub('-', name)
     # Remove any non-alphanumeric characters except hyphens
-    name = re.sub(r'[^\w-]', '', name)
+    name = _KEBAB_STRIP.sub('', name)
     # Convert to lowercase
     return name.lower()
 
 
 def get_user_input() -> tuple[str, str, str, str]:
     """Get project information from the user."""
-    print("=" * 60)
-    print("Python GenAI Template Initialization")
-    print("=" * 60)
-    print()
+    sys.stdout.write(f"{_RULE}\nPython GenAI Template Initialization\n{_RULE}\n\n")
 
     # Project name
     while True:
@@ -75,22 +125,24 @@ def get_user_input() -> tuple[str, str, str, str]:
     return package_name, pyproject_name, author_name, author_email
 
 
-def rename_package(old_name: str, new_name: str) -> bool:
+def rename_package(
+    old_path: Path,
+    new_path: Path,
+    stat_cache: dict[Path, os.stat_result | None]
+) -> bool:
     """Rename the package directory."""
-    old_path = Path("src") / old_name
-    new_path = Path("src") / new_name
-
-    if not old_path.exists():
+    if stat_cache[old_path] is None:
         print(f"❌ Package directory not found: {old_path}")
         return False
 
-    if new_path.exists():
+    if stat_cache[new_path] is not None:
         print(f"❌ Target directory already exists: {new_path}")
         return False
 
     try:
-        shutil.move(str(old_path), str(new_path))
-        print(f"✓ Renamed package: {old_name} → {new_name}")
+        # Both paths live under src/, so a plain rename is always possible
+        os.replace(old_path, new_path)
+        print(f"✓ Renamed package: {old_path.name} → {new_path.name}")
         return True
     except Exception as e:
         print(f"❌ Failed to rename package: {e}")
@@ -101,46 +153,37 @@ def update_pyproject_toml(
     package_name: str,
     project_name: str,
     author_name: str,
-    author_email: str
+    author_email: str,
+    stat_cache: dict[Path, os.stat_result | None]
 ) -> bool:
     """Update pyproject.toml with new project information."""
-    pyproject_path = Path("pyproject.toml")
-
-    if not pyproject_path.exists():
+    if not _is_file(stat_cache[PYPROJECT]):
         print("❌ pyproject.toml not found!")
         return False
 
     try:
-        content = pyproject_path.read_text()
-
-        # Update project name
-        content = re.sub(
-            r'name = "template-package"',
-            f'name = "{project_name}"',
-            content
-        )
-
-        # Update description
-        content = re.sub(
-            r'description = ".*template.*"',
-            f'description = "{project_name} - A GenAI application"',
-            content,
-            flags=re.IGNORECASE
-        )
-
-        # Update author
-        content = re.sub(
-            r'name = "Your Name"',
-            f'name = "{author_name}"',
-            content
-        )
-        content = re.sub(
-            r'email = "your\.email@example\.com"',
-            f'email = "{author_email}"',
-            content
-        )
+        # Update project name, description and author
+        replacements = {
+            "name": f'name = "{project_name}"'.encode(),
+            "description": f'description = "{project_name} - A GenAI application"'.encode(),
+            "author_name": f'name = "{author_name}"'.encode(),
+            "author_email": f'email = "{author_email}"'.encode(),
+        }
+
+        def _repl(m: re.Match[bytes]) -> bytes:
+            # Every alternative in _PYPROJECT_RE is a named group
+            assert m.lastgroup is not None
+            return replacements[m.lastgroup]
+
+        with PYPROJECT.open("r+b") as f:
+            content = f.read()
+            new_content = _PYPROJECT_RE.sub(_repl, content)
+            # Skip the write entirely when nothing was substituted
+            if new_content != content:
+                f.seek(0)
+                f.write(new_content)
+                f.truncate()
 
-        pyproject_path.write_text(content)
         print("✓ Updated pyproject.toml")
         return True
     except Exception as e:
@@ -148,11 +191,12 @@ def update_pyproject_toml(
         return False
 
 
-def update_package_init(package_name: str) -> bool:
+def update_package_init(package_path: Path) -> bool:
     """Update the package __init__.py file."""
-    init_path = Path("src") / package_name / "__init__.py"
+    package_name = package_path.name
+    init_path = package_path / "__init__.py"
 
-    if not init_path.exists():
+    if not init_path.is_file():
         print(f"⚠️  Warning: {init_path} not found")
         return True  # Not critical
 
@@ -167,7 +211,10 @@ __version__ = "0.1.0"
 
 __all__ = ["__version__"]
 '''
-        init_path.write_text(content)
+        new_content = content.encode()
+        # Leave the file (and its mtime) alone if it is already up to date
+        if init_path.read_bytes() != new_content:
+            init_path.write_bytes(new_content)
         print(f"✓ Updated {package_name}/__init__.py")
         return True
     except Exception as e:
@@ -180,15 +227,28 @@ def reinit_git() -> bool:
     print()
     response = input("Reinitialize git repository? (removes old history) [y/N]: ").strip().lower()
 
-    if response in ['y', 'yes']:
+    if response in _YES:
+        # Only needed when the user opts in, so keep it off the startup path
+        import subprocess
+
         try:
             git_dir = Path(".git")
             if git_dir.exists():
-                shutil.rmtree(git_dir)
+                if os.name == "posix":
+                    # Let rm walk the object store in C rather than stat'ing
+                    # every entry from Python
+                    subprocess.run(["rm", "-rf", str(git_dir)], check=True)
+                else:
+                    import shutil
+                    shutil.rmtree(git_dir)
                 print("✓ Removed old .git directory")
 
-            import subprocess
-            subprocess.run(["git", "init"], check=True, capture_output=True)
+            subprocess.run(
+                ["git", "init", "-q"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
             print("✓ Initialized new git repository")
             return True
         except Exception as e:
@@ -210,8 +270,12 @@ def remove_self() -> None:
 
 def main() -> int:
     """Main function."""
+    # Stat the paths we touch once up front and reuse the results
+    template_path = SRC / "template_package"
+    stat_cache = {p: _probe(p) for p in (PYPROJECT, template_path)}
+
     # Check we're in the right directory
-    if not Path("pyproject.toml").exists():
+    if not _is_file(stat_cache[PYPROJECT]):
         print("❌ Error: pyproject.toml not found!")
         print("Please run this script from the template root directory.")
         return 1
@@ -219,18 +283,18 @@ def main() -> int:
     # Get user input
     package_name, project_name, author_name, author_email = get_user_input()
 
-    print()
-    print("=" * 60)
-    print("Configuration Summary:")
-    print("=" * 60)
-    print(f"Package name: {package_name}")
-    print(f"Project name: {project_name}")
-    print(f"Author: {author_name} <{author_email}>")
-    print("=" * 60)
-    print()
+    sys.stdout.write(
+        f"\n{_RULE}\n"
+        "Configuration Summary:\n"
+        f"{_RULE}\n"
+        f"Package name: {package_name}\n"
+        f"Project name: {project_name}\n"
+        f"Author: {author_name} <{author_email}>\n"
+        f"{_RULE}\n\n"
+    )
 
     response = input("Proceed with these settings? [Y/n]: ").strip().lower()
-    if response in ['n', 'no']:
+    if response in _NO:
         print("Aborted.")
         return 0
 
@@ -238,38 +302,46 @@ def main() -> int:
     print("Initializing template...")
     print()
 
-    # Perform updates
-    success = True
-    success &= rename_package("template_package", package_name)
-    success &= update_pyproject_toml(package_name, project_name, author_name, author_email)
-    success &= update_package_init(package_name)
-    success &= reinit_git()
+    target_path = SRC / package_name
+    stat_cache[target_path] = _probe(target_path)
+
+    # Perform updates, stopping at the first failure
+    steps: list[Callable[[], bool]] = [
+        partial(rename_package, template_path, target_path, stat_cache),
+        partial(
+            update_pyproject_toml,
+            package_name, project_name, author_name, author_email, stat_cache
+        ),
+        partial(update_package_init, target_path),
+        reinit_git,
+    ]
+    success = all(step() for step in steps)
 
     if success:
-        print()
-        print("=" * 60)
-        print("✓ Template initialized successfully!")
-        print("=" * 60)
-        print()
-        print("Next steps:")
-        print("  1. Run: uv venv && uv pip install -e '.[dev]'")
-        print("  2. Run: uv run pre-commit-install")
-        print("  3. Copy .env.example to .env and add your API keys")
-        print("  4. Start building your GenAI application!")
-        print()
+        sys.stdout.write(
+            f"\n{_RULE}\n"
+            "✓ Template initialized successfully!\n"
+            f"{_RULE}\n\n"
+            "Next steps:\n"
+            "  1. Run: uv venv && uv pip install -e '.[dev]'\n"
+            "  2. Run: uv run pre-commit-install\n"
+            "  3. Copy .env.example to .env and add your API keys\n"
+            "  4. Start building your GenAI application!\n\n"
+        )
 
         # Remove this script
         response = input("Remove this initialization script? [Y/n]: ").strip().lower()
-        if response not in ['n', 'no']:
+        if response not in _NO:
             remove_self()
 
         return 0
     else:
-        print()
-        print("=" * 60)
-        print("❌ Initialization completed with errors")
-        print("=" * 60)
-        print("Please review the errors above and fix manually if needed.")
+        sys.stdout.write(
+            f"\n{_RULE}\n"
+            "❌ Initialization stopped due to errors\n"
+            f"{_RULE}\n"
+            "Please review the errors above and fix manually if needed.\n"
+        )
         return 1
 
 